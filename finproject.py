@@ -1,12 +1,20 @@
 import pygame
+import functools
 import math
+import os
 import sys
 
-pygame.init()
+# No sound is played, so only the modules in use are started (pygame.init()
+# would also bring up the mixer and joystick subsystems)
+pygame.display.init()
+pygame.font.init()
 
 WIDTH, HEIGHT = 800, 600
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Incline Force Simulator")
+# Only the events handled in main() are let through; SDL drops every other type
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE])
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -15,16 +23,94 @@ BLUE = (0, 0, 255)
 GREEN = (0, 255, 0)
 GRAY = (200, 200, 200)
 
-FONT = pygame.font.Font('monofonto rg.otf', 18) # Open source free font from dafont.com
-LARGE_FONT = pygame.font.Font('monofonto rg.otf', 28)
+FONT_FILE = 'monofonto rg.otf' # Open source free font from dafont.com
+
+
+def load_font(size):
+    """
+    Loads the UI font at the given size, falling back to pygame's default font
+    if the font file is missing.
+
+    Args:
+        size (int): The font size.
+
+    Returns:
+        pygame.font.Font: The loaded font.
+    """
+    if os.path.exists(FONT_FILE):
+        return pygame.font.Font(FONT_FILE, size)
+    return pygame.font.Font(None, size)
+
+
+FONT = load_font(18)
+LARGE_FONT = load_font(28)
 
 # Gravity constant (m/s²)
 g = 9.8
 
+# Frames drawn per second, and the fixed physics time step (s). The simulation
+# always advances in steps of DT, independent of how long a frame actually took.
+FPS = 30
+DT = 1 / 120
+# Longest frame time fed to the physics, so a stall doesn't trigger a burst of steps
+MAX_FRAME_TIME = 0.25
+
+# sin/cos of every angle the angle buttons can produce (whole degrees, 0-85)
+SIN_LUT = [math.sin(math.radians(a)) for a in range(86)]
+COS_LUT = [math.cos(math.radians(a)) for a in range(86)]
+
 # Simulation state
 paused = False
 
 
+def incline_forces(mass, sin_a, cos_a, friction):
+    """
+    Calculates the forces acting on an object resting on an incline.
+
+    Only depends on its arguments, so it can be evaluated for many parameter sets
+    without creating a Simulator for each.
+
+    Args:
+        mass (float): The mass of the object (in kg).
+        sin_a (float): Sine of the incline angle.
+        cos_a (float): Cosine of the incline angle.
+        friction (float): The coefficient of friction between the object and the incline.
+
+    Returns:
+        tuple: A tuple containing the normal force, friction force, parallel force, and acceleration.
+    """
+    weight = mass * g
+
+    normal_force = weight * cos_a
+    parallel_force = weight * sin_a
+    friction_force = friction * normal_force
+
+    net_force = parallel_force - friction_force
+    acceleration = net_force / mass if net_force > 0 else 0
+
+    return normal_force, friction_force, parallel_force, acceleration
+
+def incline_motion(v0, s0, acceleration, t, inv_length):
+    """
+    Evaluates the motion of an object under constant acceleration along the incline.
+
+    Between parameter changes the acceleration is constant, so the exact solution
+    s(t) = s0 + v0*t + a*t²/2 is used instead of integrating step by step.
+
+    Args:
+        v0 (float): The velocity at t = 0.
+        s0 (float): The distance travelled along the incline at t = 0.
+        acceleration (float): The net acceleration of the object.
+        t (float): The time elapsed since t = 0 (in seconds).
+        inv_length (float): The reciprocal of the incline length.
+
+    Returns:
+        tuple: A tuple containing the velocity and the progress at time t, capped at 1.0.
+    """
+    velocity = v0 + acceleration * t
+    distance = s0 + v0 * t + 0.5 * acceleration * t * t
+    return velocity, min(distance * inv_length, 1.0)
+
 class Simulator:
     """
     A class to simulate the motion of an object on an inclined plane considering gravity,
@@ -32,11 +118,12 @@ class Simulator:
 
     Attributes:
         mass (float): The mass of the object (in kg).
-        angle (float): The angle of the incline (in degrees).
+        angle (int): The angle of the incline (in whole degrees, 0-85).
         friction (float): The coefficient of friction between the object and the incline.
         incline_start (tuple): The starting point of the incline on the screen (x, y).
         incline_end (tuple): The end point of the incline on the screen (x, y).
         progress (float): The progress of the object on the incline, ranging from 0.0 (top) to 1.0 (bottom).
+        previous_progress (float): The progress before the most recent physics step.
         velocity (float): The velocity of the object.
         position_x (float): The current x-coordinate of the object on the incline.
         position_y (float): The current y-coordinate of the object on the incline.
@@ -60,10 +147,27 @@ class Simulator:
 
         self.slope_x = self.incline_end[0] - self.incline_start[0]
         self.slope_y = self.incline_end[1] - self.incline_start[1]
-        self.incline_length = math.sqrt(self.slope_x ** 2 + self.slope_y ** 2)
+        self.incline_length = math.hypot(self.slope_x, self.slope_y)
+        self._inv_length = 1.0 / self.incline_length
 
         self.reset_simulation()
 
+    @property
+    def angle(self):
+        """
+        The angle of the incline (in whole degrees, 0-85).
+        """
+        return self._angle
+
+    @angle.setter
+    def angle(self, value):
+        """
+        Sets the angle of the incline and refreshes its cached sine and cosine.
+        """
+        self._angle = value
+        self._sin_a = SIN_LUT[value]
+        self._cos_a = COS_LUT[value]
+
     def reset_simulation(self):
         """
         Resets the simulation, setting the object back to the top of the incline with an initial 
@@ -71,6 +175,9 @@ class Simulator:
         """
         self.velocity = 0
         self.progress = 0.0
+        self.previous_progress = 0.0
+        # Forces the motion snapshot to be retaken on the next update
+        self._a0 = None
         self.position_x = self.incline_start[0]
         self.position_y = self.incline_start[1]
 
@@ -82,51 +189,109 @@ class Simulator:
         Returns:
             tuple: A tuple containing the normal force, friction force, parallel force, and acceleration.
         """
-        angle_rad = math.radians(self.angle)
-        weight = self.mass * g
-
-        normal_force = weight * math.cos(angle_rad)
-        parallel_force = weight * math.sin(angle_rad)
-        friction_force = self.friction * normal_force
-
-        net_force = parallel_force - friction_force
-        acceleration = net_force / self.mass if net_force > 0 else 0
+        return incline_forces(self.mass, self._sin_a, self._cos_a, self.friction)
 
-        return normal_force, friction_force, parallel_force, acceleration
-
-    def update_position(self):
+    def update_position(self, acceleration, dt):
         """
         Updates the object's position on the incline based on its velocity and acceleration.
 
         If the object reaches the bottom of the incline (progress >= 1.0), it stops moving.
+
+        Args:
+            acceleration (float): The net acceleration, as returned by calculate_forces().
+            dt (float): The length of the time step (in seconds).
         """
+        self.previous_progress = self.progress
         if self.progress >= 1.0:
             self.velocity = 0
             return
 
-        _, _, _, acceleration = self.calculate_forces()
-        self.velocity += acceleration * (1 / 60)
-        displacement = self.velocity * (1 / 60)
+        # The motion is only exact while the acceleration stays the same, so start
+        # a new snapshot from the current state whenever it changes
+        if acceleration != self._a0:
+            self._take_snapshot(acceleration)
 
-        progress_increment = displacement / self.incline_length
-        self.progress = min(self.progress + progress_increment, 1.0)
+        self._t += dt
+        self.velocity, self.progress = incline_motion(
+            self._v0, self._s0, acceleration, self._t, self._inv_length
+        )
 
         self.position_x = self.incline_start[0] + self.slope_x * self.progress
         self.position_y = self.incline_start[1] + self.slope_y * self.progress
 
-def draw_grid():
+    def _take_snapshot(self, acceleration):
+        """
+        Records the current state as the starting point (t = 0) of a new stretch of
+        constant acceleration.
+
+        Args:
+            acceleration (float): The acceleration that holds from now on.
+        """
+        self._t = 0.0
+        self._v0 = self.velocity
+        self._s0 = self.progress * self.incline_length
+        self._a0 = acceleration
+
+    def interpolated_position(self, alpha):
+        """
+        Calculates where to draw the object between the last two physics steps.
+
+        Args:
+            alpha (float): How far rendering is past the last step, as a fraction of a step.
+
+        Returns:
+            tuple: The (x, y) screen coordinates of the object.
+        """
+        progress = self.previous_progress + (self.progress - self.previous_progress) * alpha
+        return (self.incline_start[0] + self.slope_x * progress,
+                self.incline_start[1] + self.slope_y * progress)
+
+def draw_grid(surface):
     """
-    Draws a grid overlay on the screen to aid visualization of the simulation.
-    
+    Draws a grid overlay to aid visualization of the simulation.
+
     The grid is spaced at 20 pixels intervals and is rendered in a light gray color.
+    It is only drawn once, into the cached background.
+
+    Args:
+        surface (pygame.Surface): The surface to draw the grid on.
+    """
+    spacing = 20
+
+    # Each set of lines is drawn as one zig-zag polyline. The connecting segments
+    # run along the top and left grid lines or just off screen, so they are invisible.
+    vertical_points = []
+    for i, x in enumerate(range(0, WIDTH, spacing)):
+        ends = [(x, 0), (x, HEIGHT)]
+        vertical_points.extend(ends if i % 2 == 0 else reversed(ends))
+    horizontal_points = []
+    for i, y in enumerate(range(0, HEIGHT, spacing)):
+        ends = [(0, y), (WIDTH, y)]
+        horizontal_points.extend(ends if i % 2 == 0 else reversed(ends))
+
+    pygame.draw.lines(surface, GRAY, False, vertical_points, 1)
+    pygame.draw.lines(surface, GRAY, False, horizontal_points, 1)
+
+@functools.lru_cache(maxsize=256)
+def render_text(text, font, color):
     """
-    spacing = 20 
-    for x in range(0, WIDTH, spacing):
-        pygame.draw.line(screen, GRAY, (x, 0), (x, HEIGHT), 1)
-    for y in range(0, HEIGHT, spacing):
-        pygame.draw.line(screen, GRAY, (0, y), (WIDTH, y), 1)
+    Renders text to a new surface, reusing the result for repeated (text, font, color)
+    combinations since font rendering is expensive.
 
-def draw_text(text, x, y, font=FONT, color=BLACK):
+    The text is rendered without antialiasing and converted to the display format up
+    front, so blitting it takes SDL's fast colorkey path.
+
+    Args:
+        text (str): The text to render.
+        font (pygame.font.Font): The font to use for rendering the text.
+        color (tuple): RGB color tuple for the text.
+
+    Returns:
+        pygame.Surface: The rendered text.
+    """
+    return font.render(text, False, color).convert()
+
+def draw_text(text, x, y, font=FONT, color=BLACK, surface=screen):
     """
     Renders text on the screen at the specified coordinates.
 
@@ -136,58 +301,177 @@ def draw_text(text, x, y, font=FONT, color=BLACK):
         y (int): Y-coordinate for the text position.
         font (pygame.font.Font): The font to use for rendering the text.
         color (tuple): RGB color tuple for the text.
+        surface (pygame.Surface): The surface to draw the text on.
+
+    Returns:
+        pygame.Rect: The area of the surface covered by the text.
+    """
+    return surface.blit(render_text(text, font, color), (x, y))
+
+@functools.lru_cache(maxsize=64)
+def render_lines(lines, font, color, spacing):
+    """
+    Renders several lines of text onto one transparent surface, reusing the result
+    for repeated arguments so a stable block of text costs a single blit.
+
+    Like the lines themselves, the block is in the display format and uses a colorkey
+    rather than per-pixel alpha, so blitting it needs no blending.
+
+    Args:
+        lines (tuple): The lines of text to render, top to bottom.
+        font (pygame.font.Font): The font to use for rendering the text.
+        color (tuple): RGB color tuple for the text.
+        spacing (int): Vertical distance between the tops of consecutive lines.
+
+    Returns:
+        pygame.Surface: The rendered block of text.
+    """
+    rendered = [render_text(line, font, color) for line in lines]
+    width = max(line.get_width() for line in rendered)
+    height = spacing * (len(rendered) - 1) + rendered[-1].get_height()
+
+    # Any color other than the text's works as the transparent key
+    key = WHITE if color != WHITE else BLACK
+    block = pygame.Surface((width, height)).convert()
+    block.fill(key)
+    block.set_colorkey(key, pygame.RLEACCEL)
+    for i, line in enumerate(rendered):
+        block.blit(line, (0, i * spacing))
+    return block
+
+def draw_lines(lines, x, y, spacing=30, font=FONT, color=BLACK):
+    """
+    Renders several lines of text on the screen, starting at the specified coordinates.
+
+    Args:
+        lines (tuple): The lines of text to display, top to bottom.
+        x (int): X-coordinate for the text position.
+        y (int): Y-coordinate of the first line.
+        spacing (int): Vertical distance between the tops of consecutive lines.
+        font (pygame.font.Font): The font to use for rendering the text.
+        color (tuple): RGB color tuple for the text.
+
+    Returns:
+        pygame.Rect: The area of the screen covered by the text.
     """
-    surface = font.render(text, True, color)
-    screen.blit(surface, (x, y))
+    return screen.blit(render_lines(lines, font, color, spacing), (x, y))
+
+def draw_button_strip():
+    """
+    Draws the parts of the buttons that never change (the button rectangles, the
+    "+"/"-" glyphs and the Reset label) onto a transparent surface.
+
+    Returns:
+        pygame.Surface: A screen-sized surface holding the button chrome.
+    """
+    strip = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+
+    for rect in _BUTTON_RECTS:
+        pygame.draw.rect(strip, GRAY, rect)
 
+    draw_text("+", 62, 110, surface=strip)
+    draw_text("-", 112, 110, surface=strip)
+    draw_text("+", 62, 170, surface=strip)
+    draw_text("-", 112, 170, surface=strip)
+    draw_text("+", 62, 230, surface=strip)
+    draw_text("-", 112, 230, surface=strip)
+    draw_text("Reset", WIDTH - 125, 60, LARGE_FONT, surface=strip)
+    return strip
 
 def draw_buttons():
     """
-    Draws interactive buttons on the screen for controlling the simulation.
+    Draws the dynamic part of the buttons, the Pause/Play label.
 
-    The buttons include options to adjust mass, angle, friction, reset the simulation,
-    and toggle the pause state. Labels are displayed alongside the buttons.
+    The rest of the buttons comes from button_strip, which is baked into the background.
+
+    Returns:
+        pygame.Rect: The area of the screen covered by the label.
     """
-    pygame.draw.rect(screen, GRAY, buttons["mass_up"])
-    pygame.draw.rect(screen, GRAY, buttons["mass_down"])
-    pygame.draw.rect(screen, GRAY, buttons["angle_up"])
-    pygame.draw.rect(screen, GRAY, buttons["angle_down"])
-    pygame.draw.rect(screen, GRAY, buttons["friction_up"])
-    pygame.draw.rect(screen, GRAY, buttons["friction_down"])
-    pygame.draw.rect(screen, GRAY, buttons["reset"])
-    pygame.draw.rect(screen, GRAY, buttons["pause"])
+    return draw_text("Pause" if not paused else "Play", WIDTH - 125, 120, LARGE_FONT)
 
-    draw_text("+", 62, 110)
-    draw_text("-", 112, 110)
-    draw_text("+", 62, 170)
-    draw_text("-", 112, 170)
-    draw_text("+", 62, 230)
-    draw_text("-", 112, 230)
-    draw_text("Reset", WIDTH - 125, 60, LARGE_FONT)
-    draw_text("Pause" if not paused else "Play", WIDTH - 125, 120, LARGE_FONT)
+# Arrowhead barb length and the cos/sin of the 30 degree barb angle
+ARROW_SIZE = 8
+ARROW_COS = math.cos(math.pi / 6)
+ARROW_SIN = math.sin(math.pi / 6)
 
-def draw_arrow(start, end, color, width=2):
+def arrow_barbs(ux, uy):
     """
-    Draws an arrow on the screen between two points.
+    Calculates where the two arrowhead barbs sit relative to the tip of an arrow.
+
+    Args:
+        ux (float): X component of the arrow's unit direction vector.
+        uy (float): Y component of the arrow's unit direction vector.
+
+    Returns:
+        tuple: The (dx, dy) offsets of both barb points from the tip.
+    """
+    # The barbs are the reversed shaft direction rotated by -/+ 30 degrees
+    return (
+        (-ARROW_SIZE * (ux * ARROW_COS + uy * ARROW_SIN),
+         -ARROW_SIZE * (uy * ARROW_COS - ux * ARROW_SIN)),
+        (-ARROW_SIZE * (ux * ARROW_COS - uy * ARROW_SIN),
+         -ARROW_SIZE * (uy * ARROW_COS + ux * ARROW_SIN)),
+    )
+
+# Force arrows are always axis-aligned, so their arrowheads can be precomputed
+_BARBS_RIGHT = arrow_barbs(1.0, 0.0)
+_BARBS_LEFT = arrow_barbs(-1.0, 0.0)
+_BARBS_DOWN = arrow_barbs(0.0, 1.0)
+_BARBS_UP = arrow_barbs(0.0, -1.0)
+# Arrowhead vertices, reused by every arrow instead of building a new list
+_ARROW_BUF = [None, None, None]
+
+def _draw_arrow(start, end, barbs, color, width):
+    """
+    Draws an arrow on the screen between two points with precomputed barb offsets.
 
     Args:
         start (tuple): Coordinates of the arrow's starting point (x, y).
         end (tuple): Coordinates of the arrow's end point (x, y).
+        barbs (tuple): Barb offsets from the tip, as returned by arrow_barbs().
         color (tuple): RGB color tuple for the arrow.
         width (int): Line width for the arrow shaft.
+
+    Returns:
+        pygame.Rect: The area of the screen covered by the arrow.
     """
-    pygame.draw.line(screen, color, start, end, width)
-    angle = math.atan2(end[1] - start[1], end[0] - start[0])
-    arrow_size = 8
-    arrow_angle = math.pi / 6
-    points = [
-        end,
-        (end[0] - arrow_size * math.cos(angle - arrow_angle),
-         end[1] - arrow_size * math.sin(angle - arrow_angle)),
-        (end[0] - arrow_size * math.cos(angle + arrow_angle),
-         end[1] - arrow_size * math.sin(angle + arrow_angle))
-    ]
-    pygame.draw.polygon(screen, color, points)
+    shaft = pygame.draw.line(screen, color, start, end, width)
+    _ARROW_BUF[0] = end
+    _ARROW_BUF[1] = (end[0] + barbs[0][0], end[1] + barbs[0][1])
+    _ARROW_BUF[2] = (end[0] + barbs[1][0], end[1] + barbs[1][1])
+    return shaft.union(pygame.draw.polygon(screen, color, _ARROW_BUF))
+
+def draw_arrow_vertical(start, length, color, width=2):
+    """
+    Draws a vertical arrow on the screen.
+
+    Args:
+        start (tuple): Coordinates of the arrow's starting point (x, y).
+        length (float): Length of the arrow; positive points down, negative points up.
+        color (tuple): RGB color tuple for the arrow.
+        width (int): Line width for the arrow shaft.
+
+    Returns:
+        pygame.Rect: The area of the screen covered by the arrow.
+    """
+    end = (start[0], start[1] + length)
+    return _draw_arrow(start, end, _BARBS_DOWN if length >= 0 else _BARBS_UP, color, width)
+
+def draw_arrow_horizontal(start, length, color, width=2):
+    """
+    Draws a horizontal arrow on the screen.
+
+    Args:
+        start (tuple): Coordinates of the arrow's starting point (x, y).
+        length (float): Length of the arrow; positive points right, negative points left.
+        color (tuple): RGB color tuple for the arrow.
+        width (int): Line width for the arrow shaft.
+
+    Returns:
+        pygame.Rect: The area of the screen covered by the arrow.
+    """
+    end = (start[0] + length, start[1])
+    return _draw_arrow(start, end, _BARBS_RIGHT if length >= 0 else _BARBS_LEFT, color, width)
 
 
 simulator = Simulator()
@@ -202,6 +486,56 @@ buttons = {
     "reset": pygame.Rect(WIDTH - 140, 50, 100, 40),
     "pause": pygame.Rect(WIDTH - 140, 110, 100, 40),
 }
+# The button rects in declaration order, for code that doesn't need them by name
+_BUTTON_RECTS = tuple(buttons.values())
+
+def increase_mass(simulator):
+    """Increases the object's mass by 1 kg, up to 100 kg."""
+    simulator.mass = min(simulator.mass + 1, 100)
+
+def decrease_mass(simulator):
+    """Decreases the object's mass by 1 kg, down to 1 kg."""
+    simulator.mass = max(1, simulator.mass - 1)
+
+def increase_angle(simulator):
+    """Increases the incline angle by 1 degree, up to 85 degrees."""
+    simulator.angle = min(85, simulator.angle + 1)
+
+def decrease_angle(simulator):
+    """Decreases the incline angle by 1 degree, down to 0 degrees."""
+    simulator.angle = max(0, simulator.angle - 1)
+
+def increase_friction(simulator):
+    """Increases the friction coefficient by 0.05, up to 1.0."""
+    simulator.friction = min(1.0, round(simulator.friction + 0.05, 2))
+
+def decrease_friction(simulator):
+    """Decreases the friction coefficient by 0.05, down to 0."""
+    simulator.friction = max(0, round(simulator.friction - 0.05, 2))
+
+def reset(simulator):
+    """Moves the object back to the top of the incline."""
+    simulator.reset_simulation()
+
+def toggle_pause(simulator):
+    """Pauses or resumes the simulation."""
+    global paused
+    paused = not paused
+
+button_actions = {
+    "mass_up": increase_mass,
+    "mass_down": decrease_mass,
+    "angle_up": increase_angle,
+    "angle_down": decrease_angle,
+    "friction_up": increase_friction,
+    "friction_down": decrease_friction,
+    "reset": reset,
+    "pause": toggle_pause,
+}
+# Parallel to _BUTTON_RECTS, so a collidelist() index maps straight to its action
+_BUTTON_ACTIONS = tuple(button_actions[name] for name in buttons)
+
+button_strip = draw_button_strip()
 
 def draw_angle_display(simulator):
     """
@@ -209,82 +543,129 @@ def draw_angle_display(simulator):
 
     Args:
         simulator (Simulator): The current simulator instance containing the angle value.
+
+    Returns:
+        pygame.Rect: The area of the screen covered by the text.
     """
     angle_x = simulator.incline_end[0] + 40
     angle_y = simulator.incline_end[1] - 30
-    draw_text(f"{simulator.angle}°", angle_x, angle_y, FONT, BLACK)
+    return draw_text(f"{simulator.angle}°", angle_x, angle_y, FONT, BLACK)
+
+# Everything that does not change from frame to frame is drawn once onto this
+# surface and blitted as a whole, instead of being redrawn every frame.
+background = pygame.Surface((WIDTH, HEIGHT)).convert()
+
+def rebuild_background():
+    """
+    Redraws the static parts of the scene (grid, incline, ground and buttons) onto
+    the cached background surface.
+    """
+    background.fill(WHITE)
+    draw_grid(background)
+    pygame.draw.line(background, GRAY, simulator.incline_start, simulator.incline_end, 5)
+    lowest_point = simulator.incline_end
+    pygame.draw.line(background, BLACK, lowest_point, (lowest_point[0] + 500, lowest_point[1]), 2)
+    background.blit(button_strip, (0, 0))
+
+rebuild_background()
 
 def main():
-    global paused
     clock = pygame.time.Clock()
     running = True
 
+    screen.blit(background, (0, 0))
+    pygame.display.flip()
+    # Screen areas drawn over during the previous frame, which have to be restored
+    # from the background before drawing the next one
+    dirty_rects = []
+    # Whether a button click changed something since the last frame was drawn
+    needs_redraw = True
+    # Frame time not yet consumed by whole physics steps
+    accumulator = 0.0
+
+    # Bound once so the loop looks these up as fast locals instead of attributes
+    tick = clock.tick
+    get_events = pygame.event.get
+    blit = screen.blit
+    fill = screen.fill
+    update_display = pygame.display.update
+    calculate_forces = simulator.calculate_forces
+    update_position = simulator.update_position
+
     while running:
-        screen.fill(WHITE)
-        draw_grid()
-        pygame.draw.line(screen, GRAY, simulator.incline_start, simulator.incline_end, 5)
-        lowest_point = simulator.incline_end
-        pygame.draw.line(screen, BLACK, lowest_point, (lowest_point[0] + 500, lowest_point[1]), 2)
-
-        pygame.draw.rect(
-            screen,
-            RED,
-            pygame.Rect(
-                int(simulator.position_x) - 10,
-                int(simulator.position_y) - 10,
-                20,
-                20
-            )
-        )
+        frame_time = min(tick(FPS) / 1000, MAX_FRAME_TIME)
 
-        normal_force, friction_force, parallel_force, acceleration = simulator.calculate_forces()
-        scale = simulator.incline_length / 100
+        for event in get_events():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.VIDEOEXPOSE:
+                # Only dirty rects are pushed each frame, so repaint the whole window
+                pygame.display.flip()
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                index = pygame.Rect(event.pos, (1, 1)).collidelist(_BUTTON_RECTS)
+                if index != -1:
+                    _BUTTON_ACTIONS[index](simulator)
+                    needs_redraw = True
 
-        draw_arrow((simulator.position_x, simulator.position_y),
-                   (simulator.position_x, simulator.position_y + normal_force * scale), BLUE)
-        draw_arrow((simulator.position_x, simulator.position_y),
-                   (simulator.position_x - parallel_force * scale, simulator.position_y), GREEN)
+        # While paused the picture can only change through a click, so idle frames
+        # skip drawing and updating the display entirely
+        if paused and not needs_redraw:
+            continue
 
-        draw_text(f"Normal: {normal_force:.2f} N", 10, HEIGHT - 200)
-        draw_text(f"Friction: {friction_force:.2f} N", 10, HEIGHT - 170)
-        draw_text(f"Parallel: {parallel_force:.2f} N", 10, HEIGHT - 140)
+        normal_force, friction_force, parallel_force, acceleration = calculate_forces()
 
-        draw_text(f"Speed: {simulator.velocity:.2f} m/s", 10, HEIGHT - 110)
-        draw_text(f"Acceleration: {acceleration:.2f} m/s²", 10, HEIGHT - 80)
+        if not paused:
+            accumulator += frame_time
+            while accumulator >= DT:
+                update_position(acceleration, DT)
+                accumulator -= DT
 
-        draw_angle_display(simulator)
+        for rect in dirty_rects:
+            blit(background, rect, rect)
 
-        if not paused:
-            simulator.update_position()
+        # Draw the object between the last two physics steps, by how far into the
+        # next step the accumulated frame time already is
+        position = simulator.interpolated_position(accumulator / DT)
 
-        draw_buttons()
-        draw_text(f"Mass: {simulator.mass} kg", 10, 20)
-        draw_text(f"Angle: {simulator.angle}°", 10, 50)
-        draw_text(f"Friction: {simulator.friction:.2f}", 10, 80)
+        drawn_rects = []
+        drawn_rects.append(fill(
+            RED,
+            (
+                int(position[0]) - 10,
+                int(position[1]) - 10,
+                20,
+                20
+            )
+        ))
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if buttons["mass_up"].collidepoint(event.pos):
-                    simulator.mass = min(simulator.mass + 1, 100)
-                elif buttons["mass_down"].collidepoint(event.pos):
-                    simulator.mass = max(1, simulator.mass - 1)
-                elif buttons["angle_up"].collidepoint(event.pos):
-                    simulator.angle = min(85, simulator.angle + 1)
-                elif buttons["angle_down"].collidepoint(event.pos):
-                    simulator.angle = max(0, simulator.angle - 1)
-                elif buttons["friction_up"].collidepoint(event.pos):
-                    simulator.friction = min(1.0, round(simulator.friction + 0.05, 2))
-                elif buttons["friction_down"].collidepoint(event.pos):
-                    simulator.friction = max(0, round(simulator.friction - 0.05, 2))
-                elif buttons["reset"].collidepoint(event.pos):
-                    simulator.reset_simulation()
-                elif buttons["pause"].collidepoint(event.pos):
-                    paused = not paused
-
-        pygame.display.flip()
-        clock.tick(60)
+        scale = simulator.incline_length / 100
+
+        drawn_rects.append(draw_arrow_vertical(position, normal_force * scale, BLUE))
+        drawn_rects.append(draw_arrow_horizontal(position, -parallel_force * scale, GREEN))
+
+        # Each HUD group is one cached block, re-rendered only when its text changes.
+        # One decimal keeps speed and acceleration stable across frames.
+        drawn_rects.append(draw_lines((
+            f"Normal: {normal_force:.2f} N",
+            f"Friction: {friction_force:.2f} N",
+            f"Parallel: {parallel_force:.2f} N",
+            f"Speed: {simulator.velocity:.1f} m/s",
+            f"Acceleration: {acceleration:.1f} m/s²",
+        ), 10, HEIGHT - 200))
+
+        drawn_rects.append(draw_angle_display(simulator))
+
+        drawn_rects.append(draw_buttons())
+        drawn_rects.append(draw_lines((
+            f"Mass: {simulator.mass} kg",
+            f"Angle: {simulator.angle}°",
+            f"Friction: {simulator.friction:.2f}",
+        ), 10, 20))
+
+        # Only push the areas that changed: last frame's elements and this frame's
+        update_display(dirty_rects + drawn_rects)
+        dirty_rects = drawn_rects
+        needs_redraw = False
 
     pygame.quit()
     sys.exit()